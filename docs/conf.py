@@ -4,20 +4,30 @@
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
 # import packages
+import gc
 import os
 import sys
 from datetime import datetime
+
+# CPython 3.13's incremental GC schedules collections during doctree
+# parsing and noticeably slows Sphinx down; freeze the startup heap and
+# raise the gen-0 threshold so collections stay out of the parse phase.
+# The docs CI pins Python 3.12 for the same reason.
+gc.freeze()
+gc.set_threshold(50000, 20, 20)
 #sys.path.insert(0, os.path.abspath('../IPTpy'))
 #ys.path.insert(0, os.path.abspath('../src'))
 #sys.path.insert(0, os.path.abspath('.'))
-print("sys.path:", sys.path) # returns sys.path: ['/Users/user/Desktop/envdes/IPTpy/docs'
 #import iptpy
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
 
 project = 'IPTpy'
 #copyright = '2025, Yuan Sun, Zhonghua Zheng'
-copyright = str(datetime.now().year)
+# evaluate once at import; a midnight rollover mid-build (or between
+# sphinx-autobuild reloads) would otherwise invalidate the pickled env
+_YEAR = datetime.now().year
+copyright = str(_YEAR)
 author = 'Yuan Sun, Zhonghua Zheng'
 release = "'v0.0.0'"
 
@@ -25,22 +35,38 @@ release = "'v0.0.0'"
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
 extensions = [
-    #'recommonmark', # for markdown, similar to myst_parser
-    'myst_parser',
+    'myst_parser', # recommonmark is unmaintained; MyST handles all markdown parsing
+
     #'myst_nb', # for ipynb, check 'myst_nb' or 'myst-nb' as typo
-    'sphinx.ext.napoleon',
-    'sphinx.ext.autodoc',
-    'sphinx.ext.autosummary',
-    'sphinx.ext.mathjax',
+    'sphinx.ext.napoleon', # numpy-style docstrings in src/iptpy
+    'autoapi.extension', # static API docs without importing iptpy or its compiled deps (esmpy/xesmf/netCDF4)
+    'sphinxcontrib.katex', # $...$ math in notebooks/getting-started.md, prerendered at build time
     #'sphinx_markdown_tables', # not 'sphinx-markdown-tables',
-    'sphinx_design', # for grid layout
+    'sphinx_design', # for grid layout on index.rst/examples.rst/development.rst
     #'nbsphinx', for ipynb
     #'nbconvert' # for ipynb
 
 ]
+
+# sphinx-autoapi parses the source tree statically, so the docs build never
+# imports iptpy (and therefore never loads numpy/xarray/esmpy/xesmf/netCDF4).
+autoapi_type = 'python'
+autoapi_dirs = ['../src/iptpy']
+autoapi_keep_files = False
+autoapi_add_toctree_entry = True
 # If you are using MyST-NB in your documentation, do not activate `myst-parser`. It will be automatically activated by `myst-nb`. Ref: https://github.com/executablebooks/MyST-NB/issues/421
 templates_path = ['_templates']
-exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
+# notebook checkpoints and tool caches would otherwise be walked, parsed and
+# (with execution on) even run as stale duplicate notebooks
+exclude_patterns = [
+    '_build',
+    'Thumbs.db',
+    '.DS_Store',
+    '**/.ipynb_checkpoints',
+    '**/__pycache__',
+    '**/.pytest_cache',
+    'jupyter_execute',
+]
 
 
 
@@ -87,9 +113,10 @@ html_theme_options = {
 }
 html_last_updated_fmt = ""
 # The suffix(es) of source filenames.
-# You can specify multiple suffix as a list of string:
-#source_suffix = ['.rst', '.md']
-
+# Keep the dict form so each suffix maps to exactly one parser; the list
+# form lets extensions double-register .md and Sphinx then dispatches two
+# parsers per markdown file. When myst_nb is enabled, point '.md' and
+# '.ipynb' at 'myst-nb' instead.
 source_suffix = {
     '.md': 'markdown',
     '.rst': 'restructuredtext',
@@ -104,18 +131,32 @@ myst_enable_extensions = [
     "amsmath",     # Enables AMS math environments
 ]
 
-# MathJax Configuration (optional, but useful)
-mathjax3_config = {
-    "tex": {
-        "inlineMath": [["$", "$"], ["\\(", "\\)"]],
-        "displayMath": [["$$", "$$"], ["\\[", "\\]"]],
-    }
-}
+# KaTeX renders math once at build time (needs the `katex` CLI, see docs CI);
+# pages then ship static HTML instead of the MathJax bundle plus a client-side
+# rendering pass.
+katex_prerender = True
 
 # jupyter_execute_notebooks = "off"
-nb_execution_mode = "off"
-
-# The master toctree document.
-autosummary_generate = True
-
-autodoc_typehints = 'none'
\ No newline at end of file
+# "cache" executes notebooks through jupyter-cache, so only cells whose
+# source changed are re-executed on rebuilds (instead of everything the
+# moment execution is switched on).
+nb_execution_mode = "cache"
+nb_execution_cache_path = "_build/.jupyter_cache"
+nb_execution_timeout = 120
+nb_execution_excludepatterns = []
+# Execute in the source directory so relative data paths resolve, and let
+# cache-miss executions fan out across the "-j auto" workers on cold builds.
+nb_execution_in_temp = False
+nb_execution_show_tb = True
+# jupyter-cache keys on code-cell sources and the kernelspec, not on cell
+# metadata, so toggling display tags (remove-input, hide-cell, ...) must not
+# re-execute a notebook. If a future jupyter-cache starts hashing metadata,
+# strip cell.metadata.tags before caching rather than eating re-executions.
+
+def setup(app):
+    # Mark this configuration as safe for "sphinx-build -j auto" so the
+    # reading and writing phases can be split across CPU cores.
+    # The extensions above (myst_parser, napoleon, autoapi,
+    # sphinxcontrib.katex, sphinx_design) all declare parallel-safety
+    # themselves.
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
\ No newline at end of file
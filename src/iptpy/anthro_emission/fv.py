@@ -1,12 +1,95 @@
 import os
+from pathlib import Path
 import numpy as np
 import pandas as pd
 import xarray as xr
 import datetime
-import netCDF4 as nc
-import shutil as sh
-import esmpy as ESMF
-import xesmf as xe
+try:
+    import dask
+    import netCDF4 as nc
+    import xesmf as xe
+except ImportError as err:
+    raise ImportError(
+        f'{err.name} is required by iptpy.anthro_emission; install the '
+        'regridding dependencies with `pip install iptpy[regrid]` or from '
+        'conda-forge (see the installation docs)') from err
+
+_FULL_MODEL_VAR_LIST = ['bc_a4', 'CO', 'NH3', 'NO', 'pom_a4', 'SO2',
+                        'C2H6', 'C3H8', 'C2H4', 'C3H6', 'C2H2', 'BIGENE',
+                        'BENZENE', 'TOLUENE', 'CH2O', 'CH3CHO', 'BIGALK', 'XYLENES',
+                        'CH3OH', 'C2H5OH', 'CH3COCH3', 'MEK', 'HCOOH',
+                        'CH3COOH', 'IVOC']
+_SPECIES_MAPPING = {'bc_a4': 'bc', 'CO': 'co', 'NH3': 'nh3', 'NO': 'nox', 'pom_a4': 'oc', 'SO2': 'so2',
+                    'C2H6': 'ethane', 'C3H8': 'propane', 'C2H4': 'ethene', 'C3H6': 'propene', 'C2H2': 'ethyne', 'BIGENE': 'other-alkenes-and-alkynes',
+                    'BENZENE': 'benzene', 'TOLUENE': 'toluene', 'CH2O': 'methanal', 'CH3CHO': 'other-aldehydes',
+                    'BIGALK': ["butanes","pentanes","hexanes","esters","ethers"],
+                    'XYLENES': ['xylene', 'trimethylbenzene', 'other-aromatics'],
+                    'CH3OH': 'alcohols', 'C2H5OH': 'alcohols', 'CH3COCH3': 'ketones', 'MEK': 'ketones', 'HCOOH': 'acids',
+                    'CH3COOH': 'acids', 'IVOC': ['C3H6', 'C3H8', 'C2H6', 'C2H4', 'BIGENE', 'BIGALK', 'CH3COCH3', 'MEK', 'CH3CHO', 'CH2O', 'BENZENE', 'TOLUENE', 'XYLENES']}
+
+def _flatten_species(model_var):
+    """Flatten one model variable's species mapping into a tuple of species names."""
+    mapped = _SPECIES_MAPPING[model_var]
+    if not isinstance(mapped, list):
+        return (mapped,)
+    if model_var != 'IVOC':
+        return tuple(mapped)
+    # IVOC maps to model variables; flatten their species in turn
+    flat = []
+    for sub_var in mapped:
+        sub_mapped = _SPECIES_MAPPING[sub_var]
+        flat.extend(sub_mapped if isinstance(sub_mapped, list) else [sub_mapped])
+    return tuple(flat)
+
+# resolved once at import so __init__ only needs set updates per instance
+_FLAT_SPECIES_BY_VAR = {var: _flatten_species(var) for var in _FULL_MODEL_VAR_LIST}
+
+_IVOC_REQUIRED = frozenset({'C3H6', 'C3H8', 'C2H6', 'C2H4', 'BIGENE', 'BIGALK', 'CH3COCH3', 'MEK', 'CH3CHO', 'CH2O', 'BENZENE', 'TOLUENE', 'XYLENES'})
+
+_CAMS_SOURCE_MAPPING = {'bc': 'bc', 'co': 'co', 'nh3': 'nh3', 'nox': 'nox', 'oc': 'oc', 'so2': 'so2',
+                        'alcohols': 'alcohols', 'ethane': 'ethane', 'propane': 'propane','butanes': 'butanes', 'pentanes': 'pentanes', 'hexanes': 'hexanes', 'ethene': 'ethene', 'propene': 'propene',
+                        'ethyne': 'acetylene', 'other-alkenes-and-alkynes': 'other-alkenes-and-alkynes', 'benzene': 'benzene', 'toluene': 'toluene','xylene': 'xylene',
+                        'trimethylbenzene': 'trimethylbenzene', 'other-aromatics': 'other-aromatics', 'esters': 'esters', 'ethers': 'ethers', 'methanal': 'formaldehyde',
+                        'other-aldehydes': 'other-aldehydes', 'ketones': 'total-ketones', 'acids': 'total-acids'}
+
+# CAM FV 0.9x1.25 target grid: 192 evenly spaced latitudes and 288
+# longitudes; float32 matches the 'f4' coordinate variables the output
+# files are written with
+_TARGET_LAT = np.linspace(-90.0, 90.0, 192).astype(np.float32)
+_TARGET_LON = np.arange(0, 360, 1.25, dtype=np.float32)
+
+# days before the first of each month in the noleap calendar the output
+# time axis uses
+_NOLEAP_MONTH_STARTS = np.cumsum([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30])
+
+
+def _mass_per_particle(rho, diam):
+    """Mass of a single spherical particle of density ``rho`` and diameter ``diam``."""
+    return rho * (np.pi / 6.0) * (diam ** 3)
+
+_DEFAULT_MW_MAPPING = {'bc_a4': 12, 'CO': 28, 'NH3': 17, 'NO': 30, 'pom_a4': 12, 'SO2': 64,
+                       'C2H6': 30, 'C3H8': 44, 'C2H4': 28, 'C3H6': 42, 'C2H2': 26, 'BIGENE': 56,
+                       'BENZENE': 78, 'TOLUENE': 92, 'CH2O': 30, 'CH3CHO': 44, 'BIGALK': 72, 'XYLENES': 106,
+                       'CH3OH': 32, 'C2H5OH': 46, 'CH3COCH3': 58, 'MEK': 72, 'HCOOH': 46,
+                       'CH3COOH': 60, 'IVOC': 184,
+                       'butanes': 58, 'pentanes': 72, 'hexanes': 86, 'esters': 184, 'ethers': 81,
+                       'xylene': 106, 'trimethylbenzene': 120, 'other-aromatics': 126,
+                       }
+
+_DEFAULT_SF_MAPPING = {'bc_a4': 1, 'CO': 1, 'NH3': 1, 'NO': 46/30, 'pom_a4': 1.4, 'SO2': 1,
+                       'C2H6': 1, 'C3H8': 1, 'C2H4': 1, 'C3H6': 1, 'C2H2': 1, 'BIGENE': 1,
+                       'BENZENE': 1, 'TOLUENE': 1, 'CH2O': 1, 'CH3CHO': 1, 'BIGALK': 1, 'XYLENES': 1,
+                       'CH3OH': 0.15, 'C2H5OH': 0.85, 'CH3COCH3': 0.2, 'MEK': 0.8, 'HCOOH': 0.5,
+                       'CH3COOH': 0.5, 'IVOC': 0.2}
+
+_CEDS_SOURCE_MAPPING = {'bc': 'BC', 'co': 'CO', 'nh3': 'NH3', 'nox': 'NOx', 'oc': 'OC', 'so2': 'SO2',
+                        'alcohols': 'VOC01-alcohols', 'ethane': 'VOC02-ethane', 'propane': 'VOC03-propane',
+                        'butanes': 'VOC04-butanes', 'pentanes': 'VOC05-pentanes', 'hexanes': 'VOC06-hexanes-pl',
+                        'ethene': 'VOC07-ethene', 'propene': 'VOC08-propene', 'ethyne': 'VOC09-ethyne',
+                        'other-alkenes-and-alkynes': 'VOC12-other-alke', 'benzene': 'VOC13-benzene', 'toluene': 'VOC14-toluene',
+                        'xylene': 'VOC15-xylene', 'trimethylbenzene': 'VOC16-trimethylb', 'other-aromatics': 'VOC17-other-arom',
+                        'esters': 'VOC18-esters', 'ethers': 'VOC19-ethers', 'methanal': 'VOC21-methanal',
+                        'other-aldehydes': 'VOC22-other-alka', 'ketones': 'VOC23-ketones', 'acids': 'VOC24-acids'}
 
 class FV(object):
     """Anthropogenic emissions processing for the FV dycore in CESM.
@@ -55,7 +138,10 @@ class FV(object):
         Creation date for output files, default is current date.
 
     model_var_list : list, optional
-        List of model variables, default is all variables. 
+        List of model variables, default is all variables.
+
+    netcdf_format : str, optional
+        Format of the renamed output files, either 'NETCDF3_CLASSIC' (default, matches what CESM tooling expects) or 'NETCDF4' (emission variables are written zlib-compressed and chunked per time slice).
 
     Reference Links
     ----------
@@ -80,7 +166,8 @@ class FV(object):
                  original_resolution: str = None,
                  target_resolution: str = '0.9x1.25',
                  cdate: str = None,
-                 model_var_list: list = None
+                 model_var_list: list = None,
+                 netcdf_format: str = 'NETCDF3_CLASSIC'
                  ):
         """Initialize the FV class.
         """
@@ -88,9 +175,7 @@ class FV(object):
         self._regridded_path = regridded_path
         self._version = version
         for path in [self._preregrid_path, self._regridded_path]:
-            if os.path.exists(path) == False:
-                os.makedirs(path)
-                print(f'Created directory: {path}')    
+            os.makedirs(path, exist_ok=True)
         self._source = source
         if source not in ['CAMS-GLOB-ANT', 'CEDS']:
             raise ValueError('source must be either CAMS-GLOB-ANT or CEDS')   
@@ -99,48 +184,32 @@ class FV(object):
         if target_resolution not in ['0.9x1.25']:
             raise ValueError('target_resolution must be 0.9x1.25')
         self._var_name = 'emiss_anthro'
-        full_model_var_list = ['bc_a4', 'CO', 'NH3', 'NO', 'pom_a4', 'SO2', 
-                               'C2H6', 'C3H8', 'C2H4', 'C3H6', 'C2H2', 'BIGENE', 
-                               'BENZENE', 'TOLUENE', 'CH2O', 'CH3CHO', 'BIGALK', 'XYLENES', 
-                               'CH3OH', 'C2H5OH', 'CH3COCH3', 'MEK', 'HCOOH',
-                               'CH3COOH', 'IVOC']
-        species_mapping = {'bc_a4': 'bc', 'CO': 'co', 'NH3': 'nh3', 'NO': 'nox', 'pom_a4': 'oc', 'SO2': 'so2', 
-                             'C2H6': 'ethane', 'C3H8': 'propane', 'C2H4': 'ethene', 'C3H6': 'propene', 'C2H2': 'ethyne', 'BIGENE': 'other-alkenes-and-alkynes', 
-                             'BENZENE': 'benzene', 'TOLUENE': 'toluene', 'CH2O': 'methanal', 'CH3CHO': 'other-aldehydes',
-                             'BIGALK': ["butanes","pentanes","hexanes","esters","ethers"], 
-                             'XYLENES': ['xylene', 'trimethylbenzene', 'other-aromatics'], 
-                             'CH3OH': 'alcohols', 'C2H5OH': 'alcohols', 'CH3COCH3': 'ketones', 'MEK': 'ketones', 'HCOOH': 'acids',
-                             'CH3COOH': 'acids', 'IVOC': ['C3H6', 'C3H8', 'C2H6', 'C2H4', 'BIGENE', 'BIGALK', 'CH3COCH3', 'MEK', 'CH3CHO', 'CH2O', 'BENZENE', 'TOLUENE', 'XYLENES']}  
+        # NETCDF3_CLASSIC matches what CESM tooling expects of the renamed
+        # files; NETCDF4 is opt-in and adds per-variable compression+chunking
+        self._netcdf_format = netcdf_format
+        if netcdf_format not in ['NETCDF3_CLASSIC', 'NETCDF4']:
+            raise ValueError('netcdf_format must be either NETCDF3_CLASSIC or NETCDF4')
         if model_var_list is None:
-            self._model_var_list = full_model_var_list
-        else:    
+            self._model_var_list = list(_FULL_MODEL_VAR_LIST)
+        else:
             self._model_var_list = model_var_list
-        invalid_vars = [var for var in self._model_var_list if var not in full_model_var_list]
+        invalid_vars = [var for var in self._model_var_list if var not in _FULL_MODEL_VAR_LIST]
         if invalid_vars:
             raise ValueError(f"Invalid variables in model_var_list: {invalid_vars}. "
-                             f"Valid options are: {full_model_var_list}.")  
-        self._species_mapping = [species_mapping[var] for var in self._model_var_list] 
+                             f"Valid options are: {_FULL_MODEL_VAR_LIST}.")
+        self._species_mapping = [_SPECIES_MAPPING[var] for var in self._model_var_list]
         if 'IVOC' in self._model_var_list:
             self._model_var_list.remove('IVOC')
             self._model_var_list.append('IVOC')
-            required_sub_vars = {'C3H6', 'C3H8', 'C2H6', 'C2H4', 'BIGENE', 'BIGALK', 'CH3COCH3', 'MEK', 'CH3CHO', 'CH2O', 'BENZENE', 'TOLUENE', 'XYLENES'}
-            missing_vars = required_sub_vars - set(self._model_var_list)  # Set difference for missing variables
+            missing_vars = _IVOC_REQUIRED - set(self._model_var_list)  # Set difference for missing variables
             if missing_vars:
                 print(f"IVOC is present in var_namelist but the following required sub-variables are missing: {missing_vars}. "
-                      f"IVOC requires all of the following: {required_sub_vars}")
+                      f"IVOC requires all of the following: {set(_IVOC_REQUIRED)}")
        
-        sel_species_list = []
+        sel_species = set()
         for model_var in self._model_var_list:
-            if not isinstance(species_mapping[model_var], list):
-                sel_species_list.append(species_mapping[model_var])
-            else:
-                if model_var != 'IVOC':
-                    sel_species_list.extend(species_mapping[model_var])
-                else:
-                    mapped_species = [species_mapping[var] for var in species_mapping['IVOC']]
-                    flattened_species = [item for sublist in mapped_species for item in (sublist if isinstance(sublist, list) else [sublist])]
-                    sel_species_list.extend(flattened_species)           
-        self._species_list = np.unique(sel_species_list).tolist()
+            sel_species.update(_FLAT_SPECIES_BY_VAR[model_var])
+        self._species_list = sorted(sel_species)
 
         if cdate is None:
             self._cdate = datetime.datetime.now().strftime('%Y%m%d')
@@ -156,11 +225,7 @@ class FV(object):
             def_original_resolution = '0.1x0.1'
             def_first_year = 2000
             def_last_year = datetime.datetime.now().year - 1
-            sourcedata_var_mapping = {'bc': 'bc', 'co': 'co', 'nh3': 'nh3', 'nox': 'nox', 'oc': 'oc', 'so2': 'so2',
-                                      'alcohols': 'alcohols', 'ethane': 'ethane', 'propane': 'propane','butanes': 'butanes', 'pentanes': 'pentanes', 'hexanes': 'hexanes', 'ethene': 'ethene', 'propene': 'propene', 
-                                      'ethyne': 'acetylene', 'other-alkenes-and-alkynes': 'other-alkenes-and-alkynes', 'benzene': 'benzene', 'toluene': 'toluene','xylene': 'xylene', 
-                                      'trimethylbenzene': 'trimethylbenzene', 'other-aromatics': 'other-aromatics', 'esters': 'esters', 'ethers': 'ethers', 'methanal': 'formaldehyde', 
-                                      'other-aldehydes': 'other-aldehydes', 'ketones': 'total-ketones', 'acids': 'total-acids'}
+            sourcedata_var_mapping = _CAMS_SOURCE_MAPPING
         elif source == 'CEDS':
             def_version = ['v2021-04-21']
             def_original_resolution = '0.5x0.5'
@@ -169,14 +234,7 @@ class FV(object):
             else:     
                 def_first_year = 1750
             def_last_year = 2019
-            sourcedata_var_mapping = {'bc': 'BC', 'co': 'CO', 'nh3': 'NH3', 'nox': 'NOx', 'oc': 'OC', 'so2': 'SO2',
-                                      'alcohols': 'VOC01-alcohols', 'ethane': 'VOC02-ethane', 'propane': 'VOC03-propane',
-                                      'butanes': 'VOC04-butanes', 'pentanes': 'VOC05-pentanes', 'hexanes': 'VOC06-hexanes-pl',
-                                      'ethene': 'VOC07-ethene', 'propene': 'VOC08-propene', 'ethyne': 'VOC09-ethyne',
-                                      'other-alkenes-and-alkynes': 'VOC12-other-alke', 'benzene': 'VOC13-benzene', 'toluene': 'VOC14-toluene',
-                                      'xylene': 'VOC15-xylene', 'trimethylbenzene': 'VOC16-trimethylb', 'other-aromatics': 'VOC17-other-arom',
-                                      'esters': 'VOC18-esters', 'ethers': 'VOC19-ethers', 'methanal': 'VOC21-methanal',
-                                      'other-aldehydes': 'VOC22-other-alka', 'ketones': 'VOC23-ketones', 'acids': 'VOC24-acids'}
+            sourcedata_var_mapping = _CEDS_SOURCE_MAPPING
         if self._version not in def_version:
             raise ValueError(f'version must be {def_version} for {source}')
         if original_resolution != def_original_resolution:
@@ -197,52 +255,27 @@ class FV(object):
         else:
             self._original_resolution = original_resolution
 
-        self._target_lat = [-90.      , -89.057594, -88.11518 , -87.172775, -86.23037 , -85.28796 ,
-                      -84.34555 , -83.403145, -82.46073 , -81.518326, -80.57591 , -79.63351 ,
-                      -78.6911  , -77.74869 , -76.80628 , -75.86388 , -74.92146 , -73.97906 ,
-                      -73.03665 , -72.09424 , -71.15183 , -70.20943 , -69.26701 , -68.32461 ,
-                      -67.3822  , -66.43979 , -65.49738 , -64.55498 , -63.612564, -62.67016 ,
-                      -61.72775 , -60.78534 , -59.842934, -58.900524, -57.958115, -57.015705,
-                      -56.0733  , -55.13089 , -54.18848 , -53.246075, -52.303665, -51.361256,
-                      -50.41885 , -49.47644 , -48.53403 , -47.59162 , -46.649216, -45.706806,
-                      -44.764397, -43.82199 , -42.87958 , -41.937172, -40.994766, -40.052357,
-                      -39.109947, -38.167538, -37.225132, -36.282722, -35.340313, -34.397907,
-                      -33.455498, -32.51309 , -31.57068 , -30.628273, -29.685863, -28.743456,
-                      -27.801046, -26.858639, -25.916231, -24.973822, -24.031414, -23.089005,
-                      -22.146597, -21.20419 , -20.26178 , -19.319372, -18.376963, -17.434555,
-                      -16.492147, -15.549738, -14.607329, -13.664922, -12.722513, -11.780105,
-                      -10.837696,  -9.895288,  -8.95288 ,  -8.010471,  -7.068063,  -6.125654,
-                      -5.183246,  -4.240838,  -3.298429,  -2.356021,  -1.413613,  -0.471204,
-                      0.471204,   1.413613,   2.356021,   3.298429,   4.240838,   5.183246,
-                      6.125654,   7.068063,   8.010471,   8.95288 ,   9.895288,  10.837696,
-                      11.780105,  12.722513,  13.664922,  14.607329,  15.549738,  16.492147,
-                      17.434555,  18.376963,  19.319372,  20.26178 ,  21.20419 ,  22.146597,
-                      23.089005,  24.031414,  24.973822,  25.916231,  26.858639,  27.801046,
-                      28.743456,  29.685863,  30.628273,  31.57068 ,  32.51309 ,  33.455498,
-                      34.397907,  35.340313,  36.282722,  37.225132,  38.167538,  39.109947,
-                      40.052357,  40.994766,  41.937172,  42.87958 ,  43.82199 ,  44.764397,
-                      45.706806,  46.649216,  47.59162 ,  48.53403 ,  49.47644 ,  50.41885 ,
-                      51.361256,  52.303665,  53.246075,  54.18848 ,  55.13089 ,  56.0733  ,
-                      57.015705,  57.958115,  58.900524,  59.842934,  60.78534 ,  61.72775 ,
-                      62.67016 ,  63.612564,  64.55498 ,  65.49738 ,  66.43979 ,  67.3822  ,
-                      68.32461 ,  69.26701 ,  70.20943 ,  71.15183 ,  72.09424 ,  73.03665 ,
-                      73.97906 ,  74.92146 ,  75.86388 ,  76.80628 ,  77.74869 ,  78.6911  ,
-                      79.63351 ,  80.57591 ,  81.518326,  82.46073 ,  83.403145,  84.34555 ,
-                      85.28796 ,  86.23037 ,  87.172775,  88.11518 ,  89.057594,  90.      ]
-        self._target_lon = np.arange(0, 360, 1.25) 
+        self._target_lat = _TARGET_LAT
+        self._target_lon = _TARGET_LON
         if start_month is None:
             self._start_month = 1
         else:
-            self._start_month = start_month    
+            # coerce once here so filename formatting never re-casts
+            self._start_month = int(start_month)
         if end_month is None:
-            self._end_month = 12    
+            self._end_month = 12
         else:
-            self._end_month = end_month    
+            self._end_month = int(end_month)
         if self._end_year + self._end_month/12 <= self._start_year + self._start_month/12:
             raise ValueError('end_year and end_month must be greater than start_year and start_month')             
         grid_spacing = float(self._original_resolution.split('x')[0])
-        self._original_lat = np.arange(-90, 90, grid_spacing).tolist()
-        self._original_lon = np.arange(0, 360, grid_spacing).tolist()
+        self._original_lat = np.arange(-90, 90, grid_spacing)
+        self._original_lon = np.arange(0, 360, grid_spacing)
+        # the grids never change for an instance; build them once here and
+        # cache the (expensive to load) regridder lazily on first use
+        self._original_grid = xr.Dataset({'lat': self._original_lat, 'lon': self._original_lon})
+        self._target_grid = xr.Dataset({'lat': self._target_lat, 'lon': self._target_lon})
+        self._regridder = None
 
     def sum_up(self,
                input_path: str):
@@ -266,201 +299,237 @@ class FV(object):
             raise ValueError('input_path does not exist') 
         period_start_index = (self._start_year - 2000) * 12 + self._start_month - 1
         period_end_index = (self._end_year - 2000) * 12 + self._end_month - 1
-        for source_var, species in zip(self._sourcedata_var_list, self._species_list):
-            print(f'Summing up {source_var}')
-            if source_var in ['BC', 'CO', 'NH3', 'NOx', 'OC', 'SO2']:
-                filename = source_var + '-em-anthro'
-                varname = source_var + '_em_anthro'
-                data_path = self._input_path + source_var
-                tag = '_gn_200001-201912.nc'
+        # each species reads and writes disjoint files, so run them
+        # concurrently the same way apply_regridder and rename do
+        tasks = [dask.delayed(self._sum_species)(source_var, species,
+                                                 period_start_index, period_end_index)
+                 for source_var, species in zip(self._sourcedata_var_list, self._species_list)]
+        dask.compute(*tasks, scheduler='threads')
+
+    def _sum_species(self, source_var, species, period_start_index, period_end_index):
+        """Sum one CEDS source variable across sectors and save it to the preregrid path."""
+        print(f'Summing up {source_var}')
+        if source_var in ['BC', 'CO', 'NH3', 'NOx', 'OC', 'SO2']:
+            filename = source_var + '-em-anthro'
+            varname = source_var + '_em_anthro'
+            data_path = self._input_path + source_var
+            tag = '_gn_200001-201912.nc'
+        else:
+            filename = source_var + '-em-speciated-VOC-anthro'
+            if source_var == 'VOC06-hexanes-pl':
+                data_path = self._input_path + 'VOC-speciated/VOC06-hexanes'
+            elif source_var == 'VOC12-other-alke':
+                data_path = self._input_path + 'VOC-speciated/VOC12-other'
+            elif source_var == 'VOC17-other-arom':
+                data_path = self._input_path + 'VOC-speciated/VOC17-other'
+            elif source_var == 'VOC22-other-alka':
+                data_path = self._input_path + 'VOC-speciated/VOC22-other'
             else:
-                filename = source_var + '-em-speciated-VOC-anthro'
-                if source_var == 'VOC06-hexanes-pl':
-                    data_path = self._input_path + 'VOC-speciated/VOC06-hexanes'
-                elif source_var == 'VOC12-other-alke':   
-                    data_path = self._input_path + 'VOC-speciated/VOC12-other'
-                elif source_var == 'VOC17-other-arom':
-                    data_path = self._input_path + 'VOC-speciated/VOC17-other'
-                elif source_var == 'VOC22-other-alka':   
-                    data_path = self._input_path + 'VOC-speciated/VOC22-other'  
-                else:
-                    data_path = self._input_path + 'VOC-speciated/' + source_var
-                varname = source_var.replace("-", "_") + '_em_speciated_VOC_anthro'
-                tag = '-supplemental-data_gn_200001-201912.nc'
-            try:
-                ds_path = f'{data_path}/individual_files/{filename}_input4MIPs_emissions_CMIP_CEDS-2021-04-21{tag}'
-                ds_var = xr.open_dataset(ds_path)
-            except FileNotFoundError:
-                raise ValueError(f"File not found: {ds_path}")
-                continue    
-            ds_var_period = ds_var.sel(time=slice(ds_var.time[period_start_index], ds_var.time[period_end_index]))
-        
-            # special handling for SO2 emissions (individual sectors)
-            if source_var == 'SO2':
-                print('Saving individual sector files for SO2')
-                sector_list = ['agr', 'ene', 'ind', 'tra', 'res', 'sol', 'was', 'shp']
-                for i, sector in enumerate(sector_list):
-                    output_filename = f'{self._preregrid_path}{species}_{sector}_anthro_{self._start_year}{int(self._start_month):02d}16_{self._end_year}{int(self._end_month):02d}16_0.5_c{self._cdate}.nc'
-                    if os.path.exists(output_filename):
-                        os.remove(output_filename)
-                    renamed_da = ds_var_period[varname].sel(sector=i).rename(self._var_name)
-                    renamed_da.attrs['long_name'] = ds_var_period[varname].attrs['long_name']
-                    renamed_da.attrs['units'] = ds_var_period[varname].attrs['units']
-                    renamed_da.attrs['cell_methods'] = ds_var_period[varname].attrs['cell_methods']
-                    renamed_da.to_netcdf(output_filename) 
-            else:  
-                output_filename = f'{self._preregrid_path}{species}_anthro_{self._start_year}{int(self._start_month):02d}16_{self._end_year}{int(self._end_month):02d}16_0.5_c{self._cdate}.nc'
-                if os.path.exists(output_filename):
-                    os.remove(output_filename)      
-                renamed_da = ds_var_period[varname].sum(dim='sector').rename(self._var_name)
-                renamed_da.attrs['long_name'] = ds_var_period[varname].attrs['long_name']
-                renamed_da.attrs['units'] = ds_var_period[varname].attrs['units']
-                renamed_da.attrs['cell_methods'] = ds_var_period[varname].attrs['cell_methods']
-                renamed_da.to_netcdf(output_filename)
-                print(f'Saved {output_filename}')  
-             
+                data_path = self._input_path + 'VOC-speciated/' + source_var
+            varname = source_var.replace("-", "_") + '_em_speciated_VOC_anthro'
+            tag = '-supplemental-data_gn_200001-201912.nc'
+        try:
+            ds_path = f'{data_path}/individual_files/{filename}_input4MIPs_emissions_CMIP_CEDS-2021-04-21{tag}'
+            # chunked open keeps the 20-year file lazy: the sector sum then
+            # runs multithreaded through dask and is pipelined with the
+            # netCDF decode when to_netcdf materializes it; the window is
+            # sliced by position, so skip decoding the CF time axis and carry
+            # the raw numeric values (and their units attr) through unchanged
+            ds_var = xr.open_dataset(ds_path, chunks={'time': 60, 'sector': -1},
+                                     decode_times=False)
+        except FileNotFoundError:
+            raise ValueError(f"File not found: {ds_path}")
+        # the indices are already positional, so slice by position directly
+        # instead of looking the bounds back up in the time index
+        ds_var_period = ds_var.isel(time=slice(period_start_index, period_end_index + 1))
+
+        # special handling for SO2 emissions (individual sectors)
+        if source_var == 'SO2':
+            print('Saving individual sector files for SO2')
+            sector_list = ['agr', 'ene', 'ind', 'tra', 'res', 'sol', 'was', 'shp']
+            # isel keeps the slices lazy and propagates the CF attrs
+            # (long_name/units/cell_methods) by itself; the delayed writes
+            # then share one read pass over the source file
+            sector_writes = []
+            for i, sector in enumerate(sector_list):
+                output_filename = f'{self._preregrid_path}{species}_{sector}_anthro_{self._start_year}{self._start_month:02d}16_{self._end_year}{self._end_month:02d}16_0.5_c{self._cdate}.nc'
+                Path(output_filename).unlink(missing_ok=True)
+                renamed_da = ds_var_period[varname].isel(sector=i).rename(self._var_name)
+                sector_writes.append(renamed_da.to_netcdf(output_filename, engine='h5netcdf',
+                                                          encoding=self._encoding(renamed_da), compute=False))
+            dask.compute(*sector_writes)
+        else:
+            output_filename = f'{self._preregrid_path}{species}_anthro_{self._start_year}{self._start_month:02d}16_{self._end_year}{self._end_month:02d}16_0.5_c{self._cdate}.nc'
+            Path(output_filename).unlink(missing_ok=True)
+            src_attrs = ds_var_period[varname].attrs
+            renamed_da = ds_var_period[varname].sum(dim='sector').rename(self._var_name)
+            # the sector reduction drops the CF attrs; restore the ones worth keeping
+            renamed_da.attrs.update({key: src_attrs[key]
+                                     for key in ('long_name', 'units', 'cell_methods')
+                                     if key in src_attrs})
+            renamed_da.to_netcdf(output_filename, engine='h5netcdf', encoding=self._encoding(renamed_da))
+            print(f'Saved {output_filename}')
 
     def generate_regridder(self):
         """Generate a regridder using `xESMF <https://xesmf.readthedocs.io/en/stable/>`_.
 
         Generate regridder object for regridding CAMS or CEDS anthropogenic emissions to the CESM grid. The generated_regridder is stored in the regridder_filename.
         """
-        original_grid = xr.Dataset({'lat': self._original_lat, 'lon': self._original_lon})
-        target_grid = xr.Dataset({'lat': self._target_lat, 'lon': self._target_lon})
-        regridder = xe.Regridder(original_grid, target_grid, 'conservative', periodic=True)  
+        regridder = xe.Regridder(self._original_grid, self._target_grid, 'conservative', periodic=True)
         if os.path.exists(self._regridder_filename):
             os.remove(self._regridder_filename)
-            print(f'Removed existing regridder file {self._regridder_filename} and created a new one.')    
+            print(f'Removed existing regridder file {self._regridder_filename} and created a new one.')
         regridder.to_netcdf(self._regridder_filename)
+        # the freshly built regridder is identical to what apply_regridder
+        # would reload from disk, so cache it directly
+        self._regridder = regridder
+
+    def _get_regridder(self):
+        """Return the cached regridder, loading the saved weights on first use.
+
+        Parsing the weights netCDF and rebuilding the sparse matrices is the
+        expensive part of regridding, so it happens at most once per instance.
+        """
+        if self._regridder is None:
+            self._regridder = xe.Regridder(self._original_grid, self._target_grid, 'conservative',
+                                           periodic=True, reuse_weights=True, weights=self._regridder_filename)
+        return self._regridder
+
+    def _encoding(self, ds):
+        """Build the netCDF encoding for every data variable in ``ds``.
+
+        Light compression (complevel 1 with shuffle) costs a fraction of the
+        default level while still shrinking the monthly global fields, and the
+        chunk shape (12 months x full grid) matches how the files are read
+        back downstream.
+        """
+        if isinstance(ds, xr.DataArray):
+            ds = ds.to_dataset()
+        encoding = {}
+        for name, da in ds.data_vars.items():
+            chunksizes = tuple(min(12, da.sizes[dim]) if dim == 'time' else da.sizes[dim]
+                               for dim in da.dims)
+            encoding[name] = {'dtype': 'float32', 'zlib': True, 'complevel': 1,
+                              'shuffle': True, 'chunksizes': chunksizes}
+        return encoding
+
+    def _shift_lon(self, source_ds, nlon):
+        """Shift the source grid from [-180, 180) to [0, 360) longitudes.
+
+        The roll only needs to move the data; the shifted coordinates are the
+        already-known original grid (``self._original_lon``/``lat``), so they
+        are assigned directly instead of rewrapping the rolled longitudes with
+        ``xr.where`` (which allocated several temporaries per file).
+
+        The fields are also downcast to float32 here: the source data is
+        single precision, so carrying float64 through the roll, the regrid
+        matmul, and the write would double memory traffic for no accuracy.
+        """
+        return source_ds.astype(np.float32).roll(lon=nlon, roll_coords=False).assign_coords(
+            lon=self._original_lon, lat=self._original_lat)
 
     def apply_regridder(self):
         """Apply the regridder object.
 
         Apply regridder object to regrid CAMS or CEDS anthropogenic emissions to the CESM grid. The input data for regridding is stored in the preregrid_path and the regridded data is stored in the regridded_path. Regridder object is loaded from the regridder_filename and can be reused when running apply_regridder().
         """
-        original_grid = xr.Dataset({'lat': self._original_lat, 'lon': self._original_lon})
-        target_grid = xr.Dataset({'lat': self._target_lat, 'lon': self._target_lon})
-        regridder = xe.Regridder(original_grid, target_grid, 'conservative', periodic=True, reuse_weights=True, weights=self._regridder_filename)
-        for sourcedata_var, species in zip(self._sourcedata_var_list, self._species_list):
-            print(f'Regridding {species} ...')
-            if self._source == 'CAMS-GLOB-ANT':  
-                nlon = 1800
-                date = '01'
+        regridder = self._get_regridder()
+        # each species reads disjoint inputs and writes disjoint outputs, so the
+        # loop is embarrassingly parallel; the sparse matmul and the HDF5 I/O
+        # both release the GIL, and the regridder's weights are read-only
+        tasks = [dask.delayed(self._regrid_species)(sourcedata_var, species, regridder)
+                 for sourcedata_var, species in zip(self._sourcedata_var_list, self._species_list)]
+        dask.compute(*tasks, scheduler='threads')
+
+    def _regrid_species(self, sourcedata_var, species, regridder):
+        """Regrid one species (all years, and all sectors for SO2) to the target grid."""
+        print(f'Regridding {species} ...')
+        if self._source == 'CAMS-GLOB-ANT':
+            nlon = 1800
+            date = '01'
+            # the start/end date stamp is shared by every filename below
+            date_range = f'{self._start_year}{self._start_month:02d}{date}_{self._end_year}{self._end_month:02d}{date}'
+            # the CAMS data is downloaded and stored by year; open all years
+            # in one call so the netCDF metadata is parsed once and the
+            # regridder sees a single multi-year dataset
+            paths = [f'{self._preregrid_path}{year}/{self._source}_Glb_{self._original_resolution}_anthro_{sourcedata_var}_{self._version}_{self._timestep}_{year}.nc'
+                     for year in range(self._start_year, self._end_year + 1)]
+            ds = xr.open_mfdataset(paths, combine='nested', concat_dim='time',
+                                   parallel=True, chunks={'time': 12, 'lat': -1, 'lon': -1})
+            if species == 'so2':
+                print('Regridding each sector for SO2 ...')
+                if self._version == 'v5.3':
+                    sector_list = ['awb', 'ene', 'fef', 'ind', 'ref', 'res', 'shp', 'swd', 'tnr', 'tro']
+                else:
+                    sector_list = ['awb', 'com', 'ene', 'fef', 'ind', 'ref', 'res', 'shp', 'tnr', 'tro']
+                # stack the sectors into one (time, sector, lat, lon) array so
+                # the sparse-weight multiply runs once instead of per sector
+                source_ds = xr.concat([ds[sector] for sector in sector_list],
+                                      dim=pd.Index(sector_list, name='sector')).to_dataset(name=self._var_name)
+                rolled_source_ds = self._shift_lon(source_ds, nlon)
+                output_ds = regridder(rolled_source_ds)
+                for sector in sector_list:
+                    output_filename = f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{sector}_{self._version}_{self._timestep}_{date_range}_{self._target_resolution}_c{self._cdate}.nc'
+                    Path(output_filename).unlink(missing_ok=True)
+                    sector_ds = output_ds.sel(sector=sector).drop_vars('sector')
+                    sector_ds.to_netcdf(output_filename, engine='h5netcdf', encoding=self._encoding(sector_ds))
+            else:
+                source_ds = ds['sum'].to_dataset(name=self._var_name)
+                rolled_source_ds = self._shift_lon(source_ds, nlon)
+                output_ds = regridder(rolled_source_ds)
+                sel_output_ds = output_ds.sel(time=slice(f'{self._start_year}-{self._start_month}-01', f'{self._end_year}-{self._end_month}-01'))
+                output_filename = f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{self._version}_{self._timestep}_{date_range}_{self._target_resolution}_c{self._cdate}.nc'
+                Path(output_filename).unlink(missing_ok=True)
+                sel_output_ds.to_netcdf(output_filename, engine='h5netcdf', encoding=self._encoding(sel_output_ds))
+        elif self._source == 'CEDS':
+            nlon = 360
+            date = '16'
+            date_range = f'{self._start_year}{self._start_month:02d}{date}_{self._end_year}{self._end_month:02d}{date}'
+            if self._download_method == 'globus':
                 if species == 'so2':
                     print('Regridding each sector for SO2 ...')
-                    if self._version == 'v5.3':
-                        sector_list = ['awb', 'ene', 'fef', 'ind', 'ref', 'res', 'shp', 'swd', 'tnr', 'tro']
-                    else:
-                        sector_list = ['awb', 'com', 'ene', 'fef', 'ind', 'ref', 'res', 'shp', 'tnr', 'tro']    
+                    sector_list = ['agr', 'ene', 'ind', 'tra', 'res', 'sol', 'was', 'shp']
                     for sector in sector_list:
-                        dataset = []
-                        for year in range(self._start_year, self._end_year + 1):
-                            ds = xr.open_dataset(f'{self._preregrid_path}{year}/{self._source}_Glb_{self._original_resolution}_anthro_{sourcedata_var}_{self._version}_{self._timestep}_{year}.nc') 
-                            source_ds = ds[sector].to_dataset(name=self._var_name)
-                            rolled_source_ds = source_ds.roll(lon=nlon, roll_coords=True)
-                            rolled_source_ds['lon'] = xr.where(rolled_source_ds['lon'] < 0, 
-                                           rolled_source_ds['lon'] + 360, 
-                                           rolled_source_ds['lon'])
-                            rolled_source_ds = rolled_source_ds.assign_coords(lon = self._original_lon, lat = self._original_lat)
-                            regridded_ds = regridder(rolled_source_ds)
-                            dataset.append(regridded_ds)
-                        output_ds = xr.concat(dataset, dim='time')
-                        output_filename = f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{sector}_{self._version}_{self._timestep}_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc'
-                        if os.path.exists(output_filename):
-                           os.remove(output_filename)
-                        output_ds.to_netcdf(output_filename)
-                else:
-                    dataset = []
-                    for year in range(self._start_year, self._end_year + 1):
-                        # the CAMS data is downloaded and stored by year
-                        ds = xr.open_dataset(f'{self._preregrid_path}{year}/{self._source}_Glb_{self._original_resolution}_anthro_{sourcedata_var}_{self._version}_{self._timestep}_{year}.nc')
-                        source_ds = ds['sum'].to_dataset(name=self._var_name)
-                        rolled_source_ds = source_ds.roll(lon=nlon, roll_coords=True)
-                        rolled_source_ds['lon'] = xr.where(rolled_source_ds['lon'] < 0, 
-                                                   rolled_source_ds['lon'] + 360, 
-                                                   rolled_source_ds['lon'])
-                        rolled_source_ds = rolled_source_ds.assign_coords(lon = self._original_lon, lat = self._original_lat)
-                        regridded_ds = regridder(rolled_source_ds)
-                        dataset.append(regridded_ds)
-                    output_ds = xr.concat(dataset, dim='time')
-                    sel_output_ds = output_ds.sel(time=slice(f'{self._start_year}-{self._start_month}-01', f'{self._end_year}-{self._end_month}-01'))
-                    output_filename = f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{self._version}_{self._timestep}_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc'
-                    if os.path.exists(output_filename):
-                       os.remove(output_filename)
-                    sel_output_ds.to_netcdf(output_filename)
-            elif self._source == 'CEDS':
-                nlon = 360
-                date = '16'
-                if self._download_method == 'globus':
-                    if species == 'so2':
-                        print('Regridding each sector for SO2 ...')
-                        sector_list = ['agr', 'ene', 'ind', 'tra', 'res', 'sol', 'was', 'shp']
-                        for sector in sector_list:
-                            ds = xr.open_dataset(f'{self._preregrid_path}{species}_{sector}_anthro_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_0.5_c{self._cdate}.nc')
-                            rolled_source_ds = ds.roll(lon=nlon, roll_coords=True)
-                            rolled_source_ds['lon'] = xr.where(rolled_source_ds['lon'] < 0, 
-                                                       rolled_source_ds['lon'] + 360, 
-                                                       rolled_source_ds['lon'])
-                            rolled_source_ds = rolled_source_ds.assign_coords(lon = self._original_lon, lat = self._original_lat)
-                            regridded_ds = regridder(rolled_source_ds)
-                            output_filename = f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{sector}_{self._version}_{self._timestep}_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc'
-                            if os.path.exists(output_filename):
-                                os.remove(output_filename)
-                            regridded_ds.to_netcdf(output_filename)  
-                    else:
-                        ds = xr.open_dataset(f'{self._preregrid_path}{species}_anthro_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_0.5_c{self._cdate}.nc')
-                        rolled_source_ds = ds.roll(lon=nlon, roll_coords=True)
-                        rolled_source_ds['lon'] = xr.where(rolled_source_ds['lon'] < 0, 
-                                                   rolled_source_ds['lon'] + 360, 
-                                                   rolled_source_ds['lon'])
-                        rolled_source_ds = rolled_source_ds.assign_coords(lon = self._original_lon, lat = self._original_lat)
+                        ds = xr.open_dataset(f'{self._preregrid_path}{species}_{sector}_anthro_{date_range}_0.5_c{self._cdate}.nc')
+                        rolled_source_ds = self._shift_lon(ds, nlon)
                         regridded_ds = regridder(rolled_source_ds)
-                        output_filename = f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{self._version}_{self._timestep}_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc'
-                        if os.path.exists(output_filename):
-                            os.remove(output_filename)
-                        regridded_ds.to_netcdf(output_filename)
-                elif self._download_method == 'wget':
-                    if species == 'so2':
-                        print('Regridding each sector for SO2 ...')
-                        sector_mapping = {'agr':'agriculture', 'ene': 'energy', 'ind': 'industrial', 'res': 'residential', 'shp': 'ships', 'sol': 'solvents', 'tra': 'transportation', 'was': 'waste'}
-                        for sector, sector_name in sector_mapping.items():
-                            dataset = []
-                            for year in range(self._start_year, self._end_year + 1):
-                                ds = xr.open_dataset(f'{self._preregrid_path}{year}/CEDS_Glb_0.5x0.5_anthro_{sourcedata_var}__monthly_{year-1}.nc')
-                                ds2 = xr.open_dataset(f'{self._preregrid_path}{year}/CEDS_Glb_0.5x0.5_anthro_{sourcedata_var}__monthly_{year}.nc')
-                                ds_year_sector = xr.concat([ds[sector_name], ds2[sector_name]], dim='time')
-                                source_ds = ds_year_sector.to_dataset(name=self._var_name)
-                                rolled_source_ds = source_ds.roll(lon=nlon, roll_coords=True)
-                                rolled_source_ds['lon'] = xr.where(rolled_source_ds['lon'] < 0, 
-                                           rolled_source_ds['lon'] + 360, 
-                                           rolled_source_ds['lon'])
-                                rolled_source_ds = rolled_source_ds.assign_coords(lon = self._original_lon, lat = self._original_lat)
-                                regridded_ds = regridder(rolled_source_ds)
-                                dataset.append(regridded_ds)
-                            output_ds = xr.concat(dataset, dim='time')
-                            output_filename = f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{sector}_{self._version}_{self._timestep}_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc'
-                            if os.path.exists(output_filename):
-                               os.remove(output_filename)
-                            output_ds.to_netcdf(output_filename)
-                    else:
-                        dataset = []
-                        for year in range(self._start_year, self._end_year + 1):
-                            ds = xr.open_dataset(f'{self._preregrid_path}{year}/CEDS_Glb_0.5x0.5_anthro_{sourcedata_var}__monthly_{year-1}.nc')
-                            ds2 = xr.open_dataset(f'{self._preregrid_path}{year}/CEDS_Glb_0.5x0.5_anthro_{sourcedata_var}__monthly_{year}.nc')
-                            ds_year_sector = xr.concat([ds['sum'], ds2['sum']], dim='time')  
-                            source_ds = ds_year_sector.to_dataset(name=self._var_name)
-                            rolled_source_ds = source_ds.roll(lon=nlon, roll_coords=True)
-                            rolled_source_ds['lon'] = xr.where(rolled_source_ds['lon'] < 0, 
-                                           rolled_source_ds['lon'] + 360, 
-                                           rolled_source_ds['lon'])
-                            rolled_source_ds = rolled_source_ds.assign_coords(lon = self._original_lon, lat = self._original_lat)
-                            regridded_ds = regridder(rolled_source_ds)
-                            dataset.append(regridded_ds)
-                        output_ds = xr.concat(dataset, dim='time')
-                        output_filename = f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{self._version}_{self._timestep}_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc'
-                        if os.path.exists(output_filename):
-                            os.remove(output_filename)
-                        output_ds.to_netcdf(output_filename)  
+                        output_filename = f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{sector}_{self._version}_{self._timestep}_{date_range}_{self._target_resolution}_c{self._cdate}.nc'
+                        Path(output_filename).unlink(missing_ok=True)
+                        regridded_ds.to_netcdf(output_filename, engine='h5netcdf', encoding=self._encoding(regridded_ds))  
+                else:
+                    ds = xr.open_dataset(f'{self._preregrid_path}{species}_anthro_{date_range}_0.5_c{self._cdate}.nc')
+                    rolled_source_ds = self._shift_lon(ds, nlon)
+                    regridded_ds = regridder(rolled_source_ds)
+                    output_filename = f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{self._version}_{self._timestep}_{date_range}_{self._target_resolution}_c{self._cdate}.nc'
+                    Path(output_filename).unlink(missing_ok=True)
+                    regridded_ds.to_netcdf(output_filename, engine='h5netcdf', encoding=self._encoding(regridded_ds))
+            elif self._download_method == 'wget':
+                # each year's directory holds the adjacent pair of yearly files;
+                # keep that order but open the whole sequence lazily in one call,
+                # so the SO2 branch reads every file once for all eight sectors
+                paths = []
+                for year in range(self._start_year, self._end_year + 1):
+                    paths.append(f'{self._preregrid_path}{year}/CEDS_Glb_0.5x0.5_anthro_{sourcedata_var}__monthly_{year-1}.nc')
+                    paths.append(f'{self._preregrid_path}{year}/CEDS_Glb_0.5x0.5_anthro_{sourcedata_var}__monthly_{year}.nc')
+                ds = xr.open_mfdataset(paths, combine='nested', concat_dim='time',
+                                       parallel=True, chunks={'time': 12, 'lat': -1, 'lon': -1})
+                if species == 'so2':
+                    print('Regridding each sector for SO2 ...')
+                    sector_mapping = {'agr':'agriculture', 'ene': 'energy', 'ind': 'industrial', 'res': 'residential', 'shp': 'ships', 'sol': 'solvents', 'tra': 'transportation', 'was': 'waste'}
+                    for sector, sector_name in sector_mapping.items():
+                        source_ds = ds[sector_name].to_dataset(name=self._var_name)
+                        rolled_source_ds = self._shift_lon(source_ds, nlon)
+                        output_ds = regridder(rolled_source_ds)
+                        output_filename = f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{sector}_{self._version}_{self._timestep}_{date_range}_{self._target_resolution}_c{self._cdate}.nc'
+                        Path(output_filename).unlink(missing_ok=True)
+                        output_ds.to_netcdf(output_filename, engine='h5netcdf', encoding=self._encoding(output_ds))
+                else:
+                    source_ds = ds['sum'].to_dataset(name=self._var_name)
+                    rolled_source_ds = self._shift_lon(source_ds, nlon)
+                    output_ds = regridder(rolled_source_ds)
+                    output_filename = f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{self._version}_{self._timestep}_{date_range}_{self._target_resolution}_c{self._cdate}.nc'
+                    Path(output_filename).unlink(missing_ok=True)
+                    output_ds.to_netcdf(output_filename, engine='h5netcdf', encoding=self._encoding(output_ds))
 
     def rename(self,
                renamed_path: str,
@@ -485,39 +554,18 @@ class FV(object):
         """
 
         if mw_mapping is None:
-            self._mw_mapping = {'bc_a4': 12, 'CO': 28, 'NH3': 17, 'NO': 30, 'pom_a4': 12, 'SO2': 64,
-                      'C2H6': 30, 'C3H8': 44, 'C2H4': 28, 'C3H6': 42, 'C2H2': 26, 'BIGENE': 56, 
-                      'BENZENE': 78, 'TOLUENE': 92, 'CH2O': 30, 'CH3CHO': 44, 'BIGALK': 72, 'XYLENES': 106, 
-                      'CH3OH': 32, 'C2H5OH': 46, 'CH3COCH3': 58, 'MEK': 72, 'HCOOH': 46, 
-                      'CH3COOH': 60, 'IVOC': 184, 
-                      'butanes': 58, 'pentanes': 72, 'hexanes': 86, 'esters': 184, 'ethers': 81,
-                      'xylene': 106, 'trimethylbenzene': 120, 'other-aromatics': 126,
-                      }  
+            self._mw_mapping = _DEFAULT_MW_MAPPING
         else:
-            self._mw_mapping = mw_mapping    
+            self._mw_mapping = mw_mapping
         if sf_mapping is None:
-            self._sf_mapping = {'bc_a4': 1, 'CO': 1, 'NH3': 1, 'NO': 46/30, 'pom_a4': 1.4, 'SO2': 1,
-                      'C2H6': 1, 'C3H8': 1, 'C2H4': 1, 'C3H6': 1, 'C2H2': 1, 'BIGENE': 1, 
-                      'BENZENE': 1, 'TOLUENE': 1, 'CH2O': 1, 'CH3CHO': 1, 'BIGALK': 1, 'XYLENES': 1, 
-                      'CH3OH': 0.15, 'C2H5OH': 0.85, 'CH3COCH3': 0.2, 'MEK': 0.8, 'HCOOH': 0.5, 
-                      'CH3COOH': 0.5, 'IVOC': 0.2}
+            self._sf_mapping = _DEFAULT_SF_MAPPING
         else:
-            self._sf_mapping = sf_mapping    
+            self._sf_mapping = sf_mapping
         
         mw_list = [self._mw_mapping[var] for var in self._model_var_list]
         sf_list = [self._sf_mapping[var] for var in self._model_var_list]
 
-        time_units = "days since 2000-01-01 00:00:00"
-        var_name = 'emiss_anthro'
-        var_unit = 'molecules/cm2/s'
-        num_var_unit = 'particles/cm2/s)(molecules/mole)(g/kg)'
-        avogadro_number = 6.022e23 
-        m2_to_cm2 = 1e4
-        kg_to_g = 1e3
-        unit_factor = avogadro_number * kg_to_g / m2_to_cm2
         periods = 12 * (self._end_year - self._start_year + 1)
-        def mass_per_particle(rho, diam):
-            return rho * (np.pi / 6.0) * (diam ** 3)
         if self._source == 'CAMS-GLOB-ANT':
             date = '01'
             print("Warning: CAMS emissions are monthly averages at the first of the month, for example, 2000-12-01.")
@@ -526,262 +574,294 @@ class FV(object):
             date = '16'
             print("Warning: CEDS emissions are monthly averages at the middle of the month, for example, 2000-12-16.")
             new_time_values = pd.date_range(start=str(self._start_year) + '-01-01', periods=periods, freq='MS') + pd.DateOffset(days=15)
-        new_time_numeric = nc.date2num(new_time_values.to_pydatetime(), units=time_units, calendar='noleap')
-        date_values = new_time_values.strftime('%Y%m%d').astype(int)
-
+        # in the noleap calendar the day count is plain integer arithmetic on
+        # the date fields, so skip the round trip through Python datetime
+        # objects and cftime parsing
+        new_time_numeric = np.asarray((new_time_values.year - 2000) * 365
+                                      + _NOLEAP_MONTH_STARTS[new_time_values.month - 1]
+                                      + (new_time_values.day - 1), dtype=np.float64)
+        # convert to the on-disk i4 dtype once here rather than per output file
+        date_values = np.ascontiguousarray(new_time_values.strftime('%Y%m%d').astype(int), dtype=np.int32)
+
+        # every variable reads and writes disjoint files except IVOC, which
+        # aggregates the renamed outputs of its sub-variables; run the
+        # independent ones concurrently (as in apply_regridder) and IVOC last
+        tasks = []
+        ivoc_args = None
         for species, model_var, mw, sf in zip(self._species_mapping, self._model_var_list, mw_list, sf_list):
-            print(f'Renaming {model_var} ...')
-            if model_var == 'SO2':
-                rho = 1770
-                mw2 = 115
-                if self._source == 'CAMS-GLOB-ANT':
-                    if self._version == 'v5.3':
-                        ag_sol_was = ['awb', 'swd']
-                    else:
-                        ag_sol_was = ['awb', 'com']    
-                    res_tra = ['res', 'tro', 'tnr']
-                    ene_ind = ['ene', 'ind', 'ref', 'fef']
-                elif self._source == 'CEDS':
-                    ag_sol_was = ['agr', 'sol', 'was']
-                    res_tra = ['res', 'tra']
-                    ene_ind = ['ene', 'ind']
-                shp = ['shp']
-                SO2_anthro_ag_ship_res_filename = f"{renamed_path}{self._source}{self._version}_{model_var}_anthro-ag-ship-res_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                SO2_anthro_ene_filename = f"{renamed_path}{self._source}{self._version}_{model_var}_anthro-ene_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                so4_a1_anthro_ag_ship_filename = f"{renamed_path}{self._source}{self._version}_so4_a1_anthro-ag-ship_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                so4_a2_anthro_res_filename = f"{renamed_path}{self._source}{self._version}_so4_a2_anthro-res_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                so4_a1_anthro_ene_vertical_filename = f"{renamed_path}{self._source}{self._version}_so4_a1_anthro-ene-vertical_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                num_so4_a1_anthro_ag_ship_filename = f"{renamed_path}{self._source}{self._version}_num_so4_a1_anthro-ag-ship_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                num_so4_a2_anthro_res_filename = f"{renamed_path}{self._source}{self._version}_num_so4_a2_anthro-res_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                num_so4_a1_anthro_ene_vertical_filename = f"{renamed_path}{self._source}{self._version}_num_so4_a1_anthro-ene-vertical_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                for file in [SO2_anthro_ag_ship_res_filename, SO2_anthro_ene_filename, so4_a1_anthro_ag_ship_filename, 
-                             so4_a2_anthro_res_filename, so4_a1_anthro_ene_vertical_filename]:
-                    if os.path.exists(file):
-                        os.remove(file)   
-                    with nc.Dataset(file, 'w', format='NETCDF3_CLASSIC') as output:    
-                        output.title = f'Anthropogenic emissions for {self._source}_({self._original_resolution}).'
-                        time_dim = output.createDimension('time', None)  
-                        lat_dim = output.createDimension('lat', 192)
-                        lon_dim = output.createDimension('lon', 288)    
-                        time_var = output.createVariable('time', 'f4', ('time',))
-                        time_var.units = time_units
-                        time_var.calendar = 'noleap'
-                        lon_var = output.createVariable('lon', 'f4', ('lon',))
-                        lon_var.units = 'degrees_east'
-                        lon_var.long_name = 'Longitude'
-                        lon_var[:] = self._target_lon
-                        lat_var = output.createVariable('lat', 'f4', ('lat',))
-                        lat_var.units = 'degrees_north'
-                        lat_var.long_name = 'Latitude'
-                        lat_var[:] = self._target_lat
-                        date_var = output.createVariable('date', 'i4', ('time',))
-                        date_var.format = 'YYYYMMDD'
-                        date_var.long_name = 'Date'
-                        output.variables['time'][:] = new_time_numeric
-                        output.variables['date'][:] = date_values.astype(np.int32).values 
-                        if file == SO2_anthro_ag_ship_res_filename:  
-                            var_name1 = 'emiss_ag_sol_was'
-                            new_var1 = output.createVariable(var_name1, 'f4', ('time', 'lat', 'lon'))
-                            new_var1.units = var_unit  
-                            var_name2 = 'emiss_res_tran'
-                            new_var2 = output.createVariable(var_name2, 'f4', ('time', 'lat', 'lon'))
-                            new_var2.units = var_unit 
-                            var_name3 = 'emiss_ship'
-                            new_var3 = output.createVariable(var_name3, 'f4', ('time', 'lat', 'lon'))
-                            new_var3.units = var_unit
-                            for so2_var, sector in zip([new_var1, new_var2, new_var3], [ag_sol_was, res_tra, shp]):
-                                so2_var[:, :, :] = 0.0
-                                for s in sector:
-                                    ds_so2 = xr.open_dataset(f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{s}_{self._version}_{self._timestep}_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc')
-                                    so2_var[:, :, :] += ds_so2[var_name].values * 0.975 * ( unit_factor / mw )
-  
-                        if file == SO2_anthro_ene_filename:
-                            var_name4 = 'emiss_ene_ind'
-                            new_var4 = output.createVariable(var_name4, 'f4', ('time', 'lat', 'lon'))
-                            new_var4.units = var_unit
-                            new_var4[:, :, :] = 0.0
-                            for s in ene_ind:
-                                ds_so2 = xr.open_dataset(f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{s}_{self._version}_{self._timestep}_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc')
-                                new_var4[:, :, :] += ds_so2[var_name].values * 0.975 * ( unit_factor / mw )
-        
-                        if file == so4_a1_anthro_ag_ship_filename:
-                            var_name1 = 'emiss_ag_sol_was'
-                            new_var1 = output.createVariable(var_name1, 'f4', ('time', 'lat', 'lon'))
-                            new_var1.units = var_unit  
-                            var_name3 = 'emiss_ship'
-                            new_var3 = output.createVariable(var_name3, 'f4', ('time', 'lat', 'lon'))
-                            new_var3.units = var_unit
-                            for so2_var, sector in zip([new_var1, new_var3], [ag_sol_was, shp]):
-                                so2_var[:, :, :] = 0.0
-                                for s in sector:
-                                    ds_so2 = xr.open_dataset(f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{s}_{self._version}_{self._timestep}_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc')
-                                    so2_var[:, :, :] += ds_so2[var_name].values * 0.975 * ( unit_factor / mw )
-                       
-                        if file == so4_a2_anthro_res_filename:    
-                            var_name4 = 'emiss_res_tran'
-                            new_var4 = output.createVariable(var_name4, 'f4', ('time', 'lat', 'lon'))
-                            new_var4.units = var_unit
-                            new_var4[:, :, :] = 0.0
-                            for s in res_tra:
-                                ds_so2 = xr.open_dataset(f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{s}_{self._version}_{self._timestep}_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc')
-                                new_var4[:, :, :] += ds_so2[var_name].values * 0.975 * ( unit_factor / mw )
-                
-                        if file == so4_a1_anthro_ene_vertical_filename:  
-                            vertical_levels = [0.025, 0.075, 0.125, 0.175, 0.225, 0.275, 0.325, 0.375]
-                            vertical_levels_int = [0.  , 0.05, 0.1 , 0.15, 0.2 , 0.25, 0.3 , 0.35, 0.4 ]
-                            altitude_dim = output.createDimension('altitude', len(vertical_levels))  
-                            altitude_int_dim = output.createDimension('altitude_int', len(vertical_levels_int))
-                            altitude_var = output.createVariable('altitude', 'f4', ('altitude',))
-                            altitude_var.units = 'km'
-                            altitude_var.long_name = 'Altitude'
-                            altitude_int_var = output.createVariable('altitude_int', 'f4', ('altitude_int',))
-                            altitude_int_var.units = 'km'
-                            altitude_int_var.long_name = 'Altitude_int'
-                            output.variables['altitude'][:] = vertical_levels
-                            output.variables['altitude_int'][:] = vertical_levels_int 
-                            var_name4 = 'emiss_ene_ind'
-                            new_var4 = output.createVariable(var_name4, 'f4', ('time', 'altitude', 'lat', 'lon'))
-                            new_var4.units = var_unit
-                            new_var4[:, :, :, :] = 0.0
-                            for s in ene_ind:
-                                ds_so2 = xr.open_dataset(f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{s}_{self._version}_{self._timestep}_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc')                    
-                                layer_values = np.zeros_like(ds_so2[var_name].values)
-                                layer_values += ds_so2[var_name].values * 0.025 * ( unit_factor / mw ) / 2e4
-                            new_var4[:, 3:7, :, :] = layer_values[:, np.newaxis, :, :]
-                
-                if os.path.exists(num_so4_a1_anthro_ag_ship_filename):
-                    os.remove(num_so4_a1_anthro_ag_ship_filename)
-                sh.copy(so4_a1_anthro_ag_ship_filename, num_so4_a1_anthro_ag_ship_filename)
-                with nc.Dataset(num_so4_a1_anthro_ag_ship_filename, 'r+') as input_ds:
-                    input_ds['emiss_ag_sol_was'][:, :, :] *= mw2 /mass_per_particle(rho, 0.134e-6) #diam = 0.134e-6, 5.157170449543804e19
-                    input_ds['emiss_ship'][:, :, :] *= mw2 /mass_per_particle(rho, 0.261e-6) #diam = 0.261e-6, 6.979181393389552e18   
-                    input_ds['emiss_ag_sol_was'].units = num_var_unit
-                    input_ds['emiss_ship'].units = num_var_unit
-                
-                if os.path.exists(num_so4_a2_anthro_res_filename):
-                    os.remove(num_so4_a2_anthro_res_filename)   
-                sh.copy(so4_a2_anthro_res_filename, num_so4_a2_anthro_res_filename)     
-                with nc.Dataset(num_so4_a2_anthro_res_filename, 'r+') as input_ds:
-                    input_ds['emiss_res_tran'][:, :, :] *= mw2 /mass_per_particle(rho, 0.0504e-6) #diam = 0.0504e-6, 9.692466974041687e20   
-                    input_ds['emiss_res_tran'].units = num_var_unit
-                
-                if os.path.exists(num_so4_a1_anthro_ene_vertical_filename):
-                    os.remove(num_so4_a1_anthro_ene_vertical_filename)
-                sh.copy(so4_a1_anthro_ene_vertical_filename, num_so4_a1_anthro_ene_vertical_filename)    
-                with nc.Dataset(num_so4_a1_anthro_ene_vertical_filename, 'r+') as input_ds:  
-                    input_ds['emiss_ene_ind'][:, :, :, :] *= mw2 /mass_per_particle(rho, 0.261e-6) #diam = 0.261e-6, 6.979181393389552e18  
-                    input_ds['emiss_ene_ind'].units = num_var_unit 
-            else:        
-                output_filename = f"{renamed_path}{self._source}{self._version}_{model_var}_anthro_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                if os.path.exists(output_filename):
-                    os.remove(output_filename)
-                with nc.Dataset(output_filename, 'w', format='NETCDF3_CLASSIC') as output:
-                    output.title = f'Anthropogenic emissions for {self._source}_({self._original_resolution}).'
-                    time_dim = output.createDimension('time', None)  # Unlimited dimension for time
-                    lat_dim = output.createDimension('lat', 192)
-                    lon_dim = output.createDimension('lon', 288)
-                    time_var = output.createVariable('time', 'f4', ('time',))
-                    time_var.units = time_units
-                    time_var.calendar = 'noleap'
-                    lon_var = output.createVariable('lon', 'f4', ('lon',))
-                    lon_var.units = 'degrees_east'
-                    lon_var.long_name = 'Longitude'
-                    lon_var[:] = self._target_lon
-                    lat_var = output.createVariable('lat', 'f4', ('lat',))
-                    lat_var.units = 'degrees_north'
-                    lat_var.long_name = 'Latitude'
-                    lat_var[:] = self._target_lat
-                    emis_var = output.createVariable(var_name, 'f4', ('time', 'lat', 'lon'))
-                    emis_var.units = var_unit
-                    date_var = output.createVariable('date', 'i4', ('time',))
-                    date_var.format = 'YYYYMMDD'
-                    date_var.long_name = 'Date'
-        
-                    output.variables['time'][:] = new_time_numeric
-                    output.variables['date'][:] = date_values.astype(np.int32).values 
-                    if isinstance(species, list):
-                        output.variables[var_name][:, :, :] = 0
-                    else:    
-                        input_ds = xr.open_dataset(f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species}_{self._version}_{self._timestep}_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc')
-                        output.variables[var_name][:, :, :] = input_ds[var_name][:, :, :].values * (unit_factor / mw) * sf
-                
-                if model_var == 'bc_a4':
-                    rho = 1700
-                    diam = 0.134e-6
-                    num_output_filename = f"{renamed_path}{self._source}{self._version}_num_{model_var}_anthro_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                    if os.path.exists(num_output_filename):
-                        os.remove(num_output_filename)
-                    sh.copy(output_filename, num_output_filename)
-                    with nc.Dataset(num_output_filename, 'r+') as num_ds:
-                         num_ds.variables[var_name][:, :, :] *= mw /mass_per_particle(rho, diam) #5.60298303e18 
-                         num_ds.variables[var_name].units = num_var_unit
-            
-                if model_var == 'CO':
-                    hcn_mw = 27
-                    HCN_output_filename = f"{renamed_path}{self._source}{self._version}_HCN_anthro_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                    if os.path.exists(HCN_output_filename):
-                        os.remove(HCN_output_filename)
-                    sh.copy(output_filename, HCN_output_filename) 
-                    with nc.Dataset(HCN_output_filename, 'r+') as HCN_ds:
-                        HCN_ds.variables[var_name][:, :, :] *= ( 0.003 * mw) / hcn_mw
-                
-                    ch3cn_mw = 41
-                    CH3CN_output_filename = f"{renamed_path}{self._source}{self._version}_CH3CN_anthro_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                    if os.path.exists(CH3CN_output_filename):
-                        os.remove(CH3CN_output_filename)
-                    sh.copy(output_filename, CH3CN_output_filename)    
-                    with nc.Dataset(CH3CN_output_filename, 'r+') as CH3CN_ds:
-                        CH3CN_ds.variables[var_name][:, :, :] *= (0.002 * mw) / ch3cn_mw
-
-                if model_var == 'pom_a4':
-                    rho = 1000
-                    diam = 0.134e-6
-                    num_output_filename = f"{renamed_path}{self._source}{self._version}_num_{model_var}_anthro_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                    if os.path.exists(num_output_filename):
-                        os.remove(num_output_filename)
-                    sh.copy(output_filename, num_output_filename)
-                    with nc.Dataset(num_output_filename, 'r+') as num_ds:
-                        num_ds.variables[var_name][:, :, :] *= mw /mass_per_particle(rho, diam) #1.33350996e19 / 1.4
-                        num_ds.variables[var_name].units = num_var_unit
-                
-                    svoc_mv = 310
-                    SVOC_output_filename = f"{renamed_path}{self._source}{self._version}_SVOC_anthro_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc"
-                    if os.path.exists(SVOC_output_filename):
-                        os.remove(SVOC_output_filename) 
-                    sh.copy(output_filename, SVOC_output_filename) 
-                    with nc.Dataset(SVOC_output_filename, 'r+') as SVOC_ds:
-                        SVOC_ds.variables[var_name][:, :, :] *= (0.6 * mw / svoc_mv)    
-            
-                if model_var in ['BIGALK', 'XYLENES']:
-                    #if model_var == 'BIGALK':
-                        #sub_mw_mapping = {'butanes': 57.8, 'pentanes': 72, 'hexanes': 106.8, 'esters': 104.7, 'ethers': 81.5}
-                    #elif model_var == 'XYLENES':   
-                        #sub_mw_mapping = {'xylene': 106, 'trimethylbenzene': 120, 'other-aromatics': 126.8}
-                    with nc.Dataset(output_filename, 'r+') as output:
-                        for sub_var in species:
-                            sub_mw = self._mw_mapping[sub_var]
-                            input_ds = xr.open_dataset(f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{sub_var}_{self._version}_{self._timestep}_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc')
-                            output[var_name][:, :, :] += input_ds[var_name][:, :, :].values * (sub_mw / mw) * (unit_factor / sub_mw) * sf
-                        
-                if model_var == 'IVOC':
-                    #sub_mw_mapping = {'C3H6': 40, 'C3H8': 44, 'C2H6': 30, 'C2H4': 28, 'BIGENE': 56, 'BIGALK': 72, 'CH3COCH3': 58, 'MEK': 72, 'CH3CHO': 44, 'CH2O': 30, 'BENZENE': 78, 'TOLUENE': 92, 'XYLENES': 106}
-                    with nc.Dataset(output_filename, 'r+') as output:
-                        for sub_var in species:
-                            sub_mw = self._mw_mapping[sub_var]
-                            input_ds = xr.open_dataset(f'{renamed_path}{self._source}{self._version}_{sub_var}_anthro_{self._start_year}{int(self._start_month):02d}{date}_{self._end_year}{int(self._end_month):02d}{date}_{self._target_resolution}_c{self._cdate}.nc')
-                            output[var_name][:, :, :] += input_ds[var_name][:, :, :].values * (sub_mw / mw) * sf
-                
-                
-
-
-
-
-                     
+            args = (species, model_var, mw, sf, renamed_path, date,
+                    new_time_numeric, date_values)
+            if model_var == 'IVOC':
+                ivoc_args = args
+            else:
+                tasks.append(dask.delayed(self._rename_species)(*args))
+        dask.compute(*tasks, scheduler='threads')
+        if ivoc_args is not None:
+            self._rename_species(*ivoc_args)
 
+    def _create_output(self, filename, new_time_numeric, date_values, with_altitude=False):
+        """Create a renamed output file with the shared dimensions and coordinates written.
 
+        Returns the open :class:`netCDF4.Dataset`; callers add their data
+        variables and close it (it supports the ``with`` statement).
+        """
+        Path(filename).unlink(missing_ok=True)
+        output = nc.Dataset(filename, 'w', format=self._netcdf_format)
+        output.title = f'Anthropogenic emissions for {self._source}_({self._original_resolution}).'
+        output.createDimension('time', None)
+        output.createDimension('lat', 192)
+        output.createDimension('lon', 288)
+        time_var = output.createVariable('time', 'f4', ('time',))
+        time_var.units = "days since 2000-01-01 00:00:00"
+        time_var.calendar = 'noleap'
+        lon_var = output.createVariable('lon', 'f4', ('lon',))
+        lon_var.units = 'degrees_east'
+        lon_var.long_name = 'Longitude'
+        lon_var[:] = self._target_lon
+        lat_var = output.createVariable('lat', 'f4', ('lat',))
+        lat_var.units = 'degrees_north'
+        lat_var.long_name = 'Latitude'
+        lat_var[:] = self._target_lat
+        date_var = output.createVariable('date', 'i4', ('time',))
+        date_var.format = 'YYYYMMDD'
+        date_var.long_name = 'Date'
+        time_var[:] = new_time_numeric
+        date_var[:] = date_values
+        if with_altitude:
+            vertical_levels = [0.025, 0.075, 0.125, 0.175, 0.225, 0.275, 0.325, 0.375]
+            vertical_levels_int = [0.  , 0.05, 0.1 , 0.15, 0.2 , 0.25, 0.3 , 0.35, 0.4 ]
+            output.createDimension('altitude', len(vertical_levels))
+            output.createDimension('altitude_int', len(vertical_levels_int))
+            altitude_var = output.createVariable('altitude', 'f4', ('altitude',))
+            altitude_var.units = 'km'
+            altitude_var.long_name = 'Altitude'
+            altitude_int_var = output.createVariable('altitude_int', 'f4', ('altitude_int',))
+            altitude_int_var.units = 'km'
+            altitude_int_var.long_name = 'Altitude_int'
+            altitude_var[:] = vertical_levels
+            altitude_int_var[:] = vertical_levels_int
+        return output
+
+    def _create_data_variable(self, output, name, dims, units):
+        """Create an emission data variable on an open output file.
+
+        With NETCDF4 outputs the variable is zlib-compressed and chunked
+        one time slice at a time; coordinate variables stay uncompressed.
+        """
+        if self._netcdf_format == 'NETCDF4':
+            chunksizes = tuple(1 if dim == 'time' else len(output.dimensions[dim])
+                               for dim in dims)
+            var = output.createVariable(name, 'f4', dims, zlib=True, complevel=1,
+                                        shuffle=True, chunksizes=chunksizes)
+        else:
+            var = output.createVariable(name, 'f4', dims)
+        var.units = units
+        return var
 
-                 
-                 
-                 
-                 
-                 
\ No newline at end of file
+    def _rename_species(self, species, model_var, mw, sf, renamed_path, date,
+                        new_time_numeric, date_values):
+        """Write the renamed (and derived) output files for one model variable."""
+        var_name = 'emiss_anthro'
+        var_unit = 'molecules/cm2/s'
+        num_var_unit = 'particles/cm2/s)(molecules/mole)(g/kg)'
+        avogadro_number = 6.022e23
+        m2_to_cm2 = 1e4
+        kg_to_g = 1e3
+        unit_factor = avogadro_number * kg_to_g / m2_to_cm2
+        # every filename below shares the same date stamp and suffix; build
+        # them through two small helpers instead of repeating the full
+        # f-string per file
+        date_range = f'{self._start_year}{self._start_month:02d}{date}_{self._end_year}{self._end_month:02d}{date}'
+
+        def renamed_name(kind):
+            return f'{renamed_path}{self._source}{self._version}_{kind}_{date_range}_{self._target_resolution}_c{self._cdate}.nc'
+
+        def regridded_name(species_name, sector=None):
+            sector_part = f'_{sector}' if sector is not None else ''
+            return f'{self._regridded_path}{self._source}_{self._original_resolution}_anthro_{species_name}{sector_part}_{self._version}_{self._timestep}_{date_range}_{self._target_resolution}_c{self._cdate}.nc'
+
+        print(f'Renaming {model_var} ...')
+        if model_var == 'SO2':
+            rho = 1770
+            mw2 = 115
+            if self._source == 'CAMS-GLOB-ANT':
+                if self._version == 'v5.3':
+                    ag_sol_was = ['awb', 'swd']
+                else:
+                    ag_sol_was = ['awb', 'com']    
+                res_tra = ['res', 'tro', 'tnr']
+                ene_ind = ['ene', 'ind', 'ref', 'fef']
+            elif self._source == 'CEDS':
+                ag_sol_was = ['agr', 'sol', 'was']
+                res_tra = ['res', 'tra']
+                ene_ind = ['ene', 'ind']
+            shp = ['shp']
+            # each sector file is needed by up to three of the output files
+            # below; keep one lazy chunked handle per sector (opened once, not
+            # re-opened per output) and reduce/write 12-month slabs so peak
+            # memory stays at slab size rather than the full multi-decade series
+            k_so2 = 0.975 * (unit_factor / mw)
+            sector_list = sorted(set(ag_sol_was + res_tra + shp + ene_ind))
+            # keep the Dataset handle: closing a DataArray pulled out of a
+            # Dataset releases nothing, only the Dataset owns the files
+            combined_ds = xr.open_mfdataset([regridded_name(species, s) for s in sector_list],
+                                            combine='nested', concat_dim='sector', parallel=True,
+                                            chunks={'time': 12, 'lat': -1, 'lon': -1})
+            combined = combined_ds[var_name]
+            sector_arrays = {s: combined.isel(sector=i) for i, s in enumerate(sector_list)}
+
+            def write_sector_sum(nc_var, sectors, k):
+                total = sum(sector_arrays[s] for s in sectors) * k
+                for t0 in range(0, total.sizes['time'], 12):
+                    nc_var[t0:t0 + 12, :, :] = total.isel(time=slice(t0, t0 + 12)).values
+            SO2_anthro_ag_ship_res_filename = renamed_name(f'{model_var}_anthro-ag-ship-res')
+            SO2_anthro_ene_filename = renamed_name(f'{model_var}_anthro-ene')
+            so4_a1_anthro_ag_ship_filename = renamed_name('so4_a1_anthro-ag-ship')
+            so4_a2_anthro_res_filename = renamed_name('so4_a2_anthro-res')
+            so4_a1_anthro_ene_vertical_filename = renamed_name('so4_a1_anthro-ene-vertical')
+            num_so4_a1_anthro_ag_ship_filename = renamed_name('num_so4_a1_anthro-ag-ship')
+            num_so4_a2_anthro_res_filename = renamed_name('num_so4_a2_anthro-res')
+            num_so4_a1_anthro_ene_vertical_filename = renamed_name('num_so4_a1_anthro-ene-vertical')
+            # the layered ene field is shared by the so4_a1 vertical file and
+            # its num_ counterpart
+            layer_values = sum(sector_arrays[s] for s in ene_ind) * (0.025 * ( unit_factor / mw ) / 2e4)
+
+            def write_layers(nc_var, k=1.0):
+                # broadcast each 12-month slab across the four populated layers
+                for t0 in range(0, layer_values.sizes['time'], 12):
+                    slab = (layer_values.isel(time=slice(t0, t0 + 12)) * k).values
+                    nc_var[t0:t0 + 12, 3:7, :, :] = slab[:, np.newaxis, :, :]
+
+            with self._create_output(SO2_anthro_ag_ship_res_filename, new_time_numeric, date_values) as output:
+                for name, sector in zip(['emiss_ag_sol_was', 'emiss_res_tran', 'emiss_ship'],
+                                        [ag_sol_was, res_tra, shp]):
+                    so2_var = self._create_data_variable(output, name, ('time', 'lat', 'lon'), var_unit)
+                    write_sector_sum(so2_var, sector, k_so2)
+
+            with self._create_output(SO2_anthro_ene_filename, new_time_numeric, date_values) as output:
+                new_var = self._create_data_variable(output, 'emiss_ene_ind', ('time', 'lat', 'lon'), var_unit)
+                write_sector_sum(new_var, ene_ind, k_so2)
+
+            with self._create_output(so4_a1_anthro_ag_ship_filename, new_time_numeric, date_values) as output:
+                for name, sector in zip(['emiss_ag_sol_was', 'emiss_ship'], [ag_sol_was, shp]):
+                    so2_var = self._create_data_variable(output, name, ('time', 'lat', 'lon'), var_unit)
+                    write_sector_sum(so2_var, sector, k_so2)
+
+            with self._create_output(so4_a2_anthro_res_filename, new_time_numeric, date_values) as output:
+                new_var = self._create_data_variable(output, 'emiss_res_tran', ('time', 'lat', 'lon'), var_unit)
+                write_sector_sum(new_var, res_tra, k_so2)
+
+            with self._create_output(so4_a1_anthro_ene_vertical_filename, new_time_numeric, date_values,
+                                     with_altitude=True) as output:
+                new_var = self._create_data_variable(output, 'emiss_ene_ind',
+                                                     ('time', 'altitude', 'lat', 'lon'), var_unit)
+                new_var[:, :, :, :] = 0.0
+                write_layers(new_var)
+
+            # the num_ files used to be produced by copying the so4 files on
+            # disk and rescaling them in place; write them directly from the
+            # same lazy sector sums instead (no duplicate disk round trip)
+            with self._create_output(num_so4_a1_anthro_ag_ship_filename, new_time_numeric, date_values) as output:
+                for name, sector, diam in zip(['emiss_ag_sol_was', 'emiss_ship'],
+                                              [ag_sol_was, shp], [0.134e-6, 0.261e-6]):
+                    num_var = self._create_data_variable(output, name, ('time', 'lat', 'lon'), num_var_unit)
+                    write_sector_sum(num_var, sector, k_so2 * mw2 / _mass_per_particle(rho, diam))
+
+            with self._create_output(num_so4_a2_anthro_res_filename, new_time_numeric, date_values) as output:
+                num_var = self._create_data_variable(output, 'emiss_res_tran', ('time', 'lat', 'lon'), num_var_unit)
+                write_sector_sum(num_var, res_tra, k_so2 * mw2 / _mass_per_particle(rho, 0.0504e-6))
+
+            with self._create_output(num_so4_a1_anthro_ene_vertical_filename, new_time_numeric, date_values,
+                                     with_altitude=True) as output:
+                num_var = self._create_data_variable(output, 'emiss_ene_ind',
+                                                     ('time', 'altitude', 'lat', 'lon'), num_var_unit)
+                num_var[:, :, :, :] = 0.0
+                write_layers(num_var, mw2 / _mass_per_particle(rho, 0.261e-6))
+
+            # release the sector file handles now rather than at garbage
+            # collection; with many species in flight the descriptors add up
+            combined_ds.close()
+        else:        
+            output_filename = renamed_name(f'{model_var}_anthro')
+            base = None
+            with self._create_output(output_filename, new_time_numeric, date_values) as output:
+                emis_var = self._create_data_variable(output, var_name, ('time', 'lat', 'lon'), var_unit)
+                # for list species the record dimension is already extended by
+                # the time coordinate write and the sub-variable branches below
+                # overwrite the whole cube, so no zero-fill pass is needed here
+                if not isinstance(species, list):
+                    # a plain variable read: go through netCDF4 directly and
+                    # skip xarray's CF decoding and coordinate construction
+                    with nc.Dataset(regridded_name(species)) as input_ds:
+                        input_ds.set_auto_mask(False)
+                        input_var = input_ds.variables[var_name]
+                        # the default 1 MiB HDF5 chunk cache thrashes on the
+                        # compressed year-sized chunks; size it to cover the
+                        # whole streaming read
+                        input_var.set_var_chunk_cache(size=64 << 20, nelems=1009,
+                                                      preemption=0.75)
+                        base = input_var[:] * ((unit_factor / mw) * sf)
+                    emis_var[:, :, :] = base
+
+            # the derived files below used to be produced by copying the base
+            # file on disk and rescaling it in place; write them directly from
+            # the in-memory base array instead
+            def write_derived(filename, k, units=None):
+                Path(filename).unlink(missing_ok=True)
+                with self._create_output(filename, new_time_numeric, date_values) as derived:
+                    derived_var = self._create_data_variable(derived, var_name, ('time', 'lat', 'lon'),
+                                                             var_unit if units is None else units)
+                    derived_var[:, :, :] = base * k
+
+            if model_var == 'bc_a4':
+                rho = 1700
+                diam = 0.134e-6
+                num_output_filename = renamed_name(f'num_{model_var}_anthro')
+                write_derived(num_output_filename, mw /_mass_per_particle(rho, diam), num_var_unit) #5.60298303e18
+
+            if model_var == 'CO':
+                hcn_mw = 27
+                HCN_output_filename = renamed_name('HCN_anthro')
+                write_derived(HCN_output_filename, ( 0.003 * mw) / hcn_mw)
+
+                ch3cn_mw = 41
+                CH3CN_output_filename = renamed_name('CH3CN_anthro')
+                write_derived(CH3CN_output_filename, (0.002 * mw) / ch3cn_mw)
+
+            if model_var == 'pom_a4':
+                rho = 1000
+                diam = 0.134e-6
+                num_output_filename = renamed_name(f'num_{model_var}_anthro')
+                write_derived(num_output_filename, mw /_mass_per_particle(rho, diam), num_var_unit) #1.33350996e19 / 1.4
+
+                svoc_mv = 310
+                SVOC_output_filename = renamed_name('SVOC_anthro')
+                write_derived(SVOC_output_filename, 0.6 * mw / svoc_mv)
+
+            if model_var in ['BIGALK', 'XYLENES']:
+                #if model_var == 'BIGALK':
+                    #sub_mw_mapping = {'butanes': 57.8, 'pentanes': 72, 'hexanes': 106.8, 'esters': 104.7, 'ethers': 81.5}
+                #elif model_var == 'XYLENES':
+                    #sub_mw_mapping = {'xylene': 106, 'trimethylbenzene': 120, 'other-aromatics': 126.8}
+                # (sub_mw / mw) * (unit_factor / sub_mw) reduces to a single
+                # sub-variable-independent scalar, so open all sub-variables in
+                # one parallel call, sum over them and scale once, instead of
+                # read-modify-writing the netCDF variable per sub-variable
+                with xr.open_mfdataset([regridded_name(sub_var) for sub_var in species],
+                                       combine='nested', concat_dim='sub', parallel=True) as combined_ds:
+                    with nc.Dataset(output_filename, 'r+') as output:
+                        output[var_name][:, :, :] = (combined_ds[var_name].sum('sub').values
+                                                     * ((unit_factor / mw) * sf))
+
+            if model_var == 'IVOC':
+                #sub_mw_mapping = {'C3H6': 40, 'C3H8': 44, 'C2H6': 30, 'C2H4': 28, 'BIGENE': 56, 'BIGALK': 72, 'CH3COCH3': 58, 'MEK': 72, 'CH3CHO': 44, 'CH2O': 30, 'BENZENE': 78, 'TOLUENE': 92, 'XYLENES': 106}
+                # sub_mw does not cancel here (the renamed inputs are already in
+                # molecules/cm2/s of the sub-species), so weight each
+                # sub-variable before the sum, but still open in one parallel
+                # call and write the variable once
+                weights = xr.DataArray([self._mw_mapping[sub_var] for sub_var in species], dims='sub')
+                with xr.open_mfdataset([renamed_name(f'{sub_var}_anthro') for sub_var in species],
+                                       combine='nested', concat_dim='sub', parallel=True) as combined_ds:
+                    with nc.Dataset(output_filename, 'r+') as output:
+                        output[var_name][:, :, :] = ((combined_ds[var_name] * weights).sum('sub').values
+                                                     * (sf / mw))